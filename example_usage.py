@@ -16,6 +16,7 @@ def main():
     print("=" * 60)
     print("EXAMPLE 1: List All Licenses")
     print("=" * 60)
+    # Only summary fields are fetched; the license texts stay on the server
     licenses = manager.list_licenses()
     print(f"Total licenses in database: {len(licenses)}\n")
 
@@ -27,9 +28,9 @@ def main():
     print("=" * 60)
     print("EXAMPLE 2: Get MIT License Details")
     print("=" * 60)
-    mit_licenses = manager.find_by_short_name("MIT")
+    mit_licenses = manager.find_by_short_name("MIT", include_docs=False)
     if mit_licenses:
-        print_license(mit_licenses[0], detailed=True)
+        print_license(manager.get_license(mit_licenses[0]['_id']), detailed=True)
     else:
         print("MIT license not found\n")
 
@@ -38,8 +39,8 @@ def main():
     print("EXAMPLE 3: Create a New License (GPL-3.0)")
     print("=" * 60)
 
-    # Check if GPL-3.0 already exists
-    existing = manager.find_by_short_name("GPL-3.0")
+    # Check if GPL-3.0 already exists (ID and revision are enough here)
+    existing = manager.find_by_short_name("GPL-3.0", include_docs=False)
 
     if existing:
         print("GPL-3.0 already exists in database")
@@ -47,16 +48,23 @@ def main():
         print(f"  Revision: {existing[0]['_rev']}\n")
     else:
         try:
-            result = manager.create_license(
-                full_name="GNU General Public License v3.0",
-                short_name="GPL-3.0",
-                text="This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.",
-                osi_approved=True,
-                checked=False
-            )
-            print("[OK] Created GPL-3.0 license")
-            print(f"  ID: {result['id']}")
-            print(f"  Revision: {result['rev']}\n")
+            # Writes inside a batch are sent together with one request
+            with manager.batch() as batch:
+                manager.create_license(
+                    full_name="GNU General Public License v3.0",
+                    short_name="GPL-3.0",
+                    text="This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.",
+                    osi_approved=True,
+                    checked=False
+                )
+
+            result = batch.results[0]
+            if result.get('ok'):
+                print("[OK] Created GPL-3.0 license")
+                print(f"  ID: {result['id']}")
+                print(f"  Revision: {result['rev']}\n")
+            else:
+                print(f"[ERROR] Failed to create license: {result.get('reason')}\n")
         except Exception as e:
             print(f"[ERROR] Failed to create license: {e}\n")
 
@@ -65,15 +73,12 @@ def main():
     print("EXAMPLE 4: License Statistics")
     print("=" * 60)
 
-    total = manager.count_licenses()
-    osi_approved = len(manager.get_osi_approved_licenses())
-    checked = len(manager.get_checked_licenses())
-    unchecked = len(manager.get_unchecked_licenses())
+    stats = manager.get_stats()
 
-    print(f"Total licenses:       {total}")
-    print(f"OSI approved:         {osi_approved}")
-    print(f"Reviewed (checked):   {checked}")
-    print(f"Pending review:       {unchecked}\n")
+    print(f"Total licenses:       {stats['total']}")
+    print(f"OSI approved:         {stats['osi']}")
+    print(f"Reviewed (checked):   {stats['checked']}")
+    print(f"Pending review:       {stats['unchecked']}\n")
 
     # Example 5: List licenses pending review
     print("=" * 60)
@@ -89,29 +94,25 @@ def main():
         print("All licenses have been reviewed!")
     print()
 
-    # Example 6: Update a license (mark as checked)
+    # Example 6: Update licenses (mark as checked)
     print("=" * 60)
-    print("EXAMPLE 6: Mark a License as Reviewed")
+    print("EXAMPLE 6: Mark Pending Licenses as Reviewed")
     print("=" * 60)
 
     if unchecked_licenses:
-        # Get the first unchecked license
-        license_to_update = unchecked_licenses[0]
-
-        print(f"Marking '{license_to_update['shortName']}' as reviewed...")
+        names = {license['_id']: license['shortName'] for license in unchecked_licenses}
+        print(f"Marking {len(names)} license(s) as reviewed...")
 
         try:
-            result = manager.update_license(
-                license_id=license_to_update['_id'],
-                rev=license_to_update['_rev'],
-                full_name=license_to_update['fullName'],
-                short_name=license_to_update['shortName'],
-                text=license_to_update.get('text', ''),
-                osi_approved=license_to_update.get('OSIApproved', False),
-                checked=True  # Mark as checked
-            )
-            print(f"[OK] License updated successfully")
-            print(f"  New revision: {result['rev']}\n")
+            # One _bulk_get for the current revisions, one _bulk_docs for the updates
+            results = manager.bulk_mark_checked(names)
+            for result in results:
+                name = names.get(result['id'], result['id'])
+                if result.get('ok'):
+                    print(f"  [OK] {name:15} - new revision: {result['rev']}")
+                else:
+                    print(f"  [ERROR] {name:15} - {result.get('reason')}")
+            print()
         except Exception as e:
             print(f"[ERROR] Failed to update: {e}\n")
     else:
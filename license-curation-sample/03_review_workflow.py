@@ -108,15 +108,8 @@ def review_license_interactive(manager, license_data, index, total):
 
 def auto_approve_license(manager, license_data):
     """Automatically approve a license (for demo purposes)"""
-    result = manager.update_license(
-        license_id=license_data['_id'],
-        rev=license_data['_rev'],
-        full_name=license_data['fullName'],
-        short_name=license_data['shortName'],
-        text=license_data['text'],
-        osi_approved=license_data['OSIApproved'],
-        checked=True
-    )
+    # Only the changed field is sent; the license text stays on the server
+    result = manager.update_license_fields(license_data['_id'], checked=True)
 
     return result and result.get('ok')
 
@@ -137,7 +137,8 @@ def generate_text_report(manager):
 
 def export_to_json(manager, output_file="license_report.json"):
     """Export all licenses to JSON"""
-    all_licenses = manager.list_licenses()
+    # The export includes the license texts, so fetch full documents
+    all_licenses = manager.list_licenses(fields=None)
 
     # Prepare data for export
     export_data = {
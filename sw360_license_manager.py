@@ -4,15 +4,285 @@ SW360 License Manager - Python Interface for CouchDB License Curation
 
 This module provides a Python interface for managing licenses in SW360's CouchDB database.
 No external dependencies required - uses only Python standard library.
+If orjson is installed, it is used for faster JSON encoding and decoding.
 """
 
+import asyncio
+import codecs
+import copy
+import functools
+import gzip
+import itertools
 import json
-import urllib.request
-import urllib.error
+import re
+import http.client
+import secrets
+import threading
+import time
 import urllib.parse
-from typing import Dict, List, Optional, Any
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Any, Sequence, Tuple
 from base64 import b64encode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Basic auth header values by (username, password), shared by all managers
+_AUTH_CACHE: Dict[Tuple[str, str], str] = {}
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode data as a UTF-8 JSON request body."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a UTF-8 JSON response body."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class CouchDBError(Exception):
+    """
+    Raised when CouchDB answers a request with an HTTP error status.
+
+    Attributes:
+        status: HTTP status code (e.g., 404, 409)
+    """
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"HTTP {status} Error: {body}")
+        self.status = status
+
+
+def _iter_json_array(chunks: Iterable[str], key: str) -> Iterator[Any]:
+    """
+    Incrementally decode the items of a JSON array member of a response.
+
+    For a response such as {"docs": [{...}, {...}], "bookmark": "..."},
+    each element of the "docs" array is yielded as soon as it has been
+    received, without buffering the whole body. Array elements must be
+    JSON objects or arrays.
+
+    Args:
+        chunks: Decoded text chunks of the response body
+        key: Name of the array member (e.g., "docs")
+
+    Yields:
+        Decoded array elements
+    """
+    decoder = json.JSONDecoder()
+    marker = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    chunks = iter(chunks)
+    buffer = ""
+
+    # Read until the start of the array
+    match = None
+    while match is None:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        buffer += chunk
+        match = marker.search(buffer)
+    pos = match.end()
+
+    while True:
+        # Skip separators; read more data if the buffer runs out
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+
+        try:
+            if pos == len(buffer):
+                raise json.JSONDecodeError("Incomplete array", buffer, pos)
+            item, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        yield item
+
+
+class _LRUCache:
+    """
+    Small thread-safe least-recently-used cache.
+
+    Used by SW360LicenseManager to memoize license lookups.
+
+    Attributes:
+        generation: Counter bumped whenever entries are invalidated. A
+            lookup reads it before fetching and passes it to put(), so a
+            result fetched before a concurrent invalidation is not stored.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.generation = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """
+        Store value, evicting the least recently used entry if full.
+
+        If generation is given and entries were invalidated since it was
+        read, the value may be outdated and is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop_matching(self, match: Callable[[Hashable, Any], bool]):
+        """
+        Remove the entries for which match(key, value) is true.
+
+        The entries are scanned and removed, and the generation bumped,
+        under one lock, so no concurrent put() can slip in between.
+        """
+        with self._lock:
+            self.generation += 1
+            for key in [key for key, value in self._data.items() if match(key, value)]:
+                del self._data[key]
+
+    def clear(self):
+        """Remove all entries and bump the generation."""
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+
+class _TTLCache:
+    """
+    Small thread-safe cache whose entries expire after a fixed time.
+
+    Used by SW360LicenseManager to reuse recent read responses.
+
+    Attributes:
+        generation: Counter bumped by clear(); see _LRUCache
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.generation = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl: float, generation: Optional[int] = None):
+        """
+        Store value for ttl seconds, evicting the oldest entry if full.
+
+        If generation is given and the cache was cleared since it was
+        read, the value may be outdated and is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and bump the generation."""
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+
+class _Batch:
+    """
+    Write operations queued by SW360LicenseManager.batch().
+
+    Attributes:
+        docs: Documents waiting to be written
+        results: _bulk_docs results, one per queued operation, filled in
+            when the batch is flushed
+    """
+
+    def __init__(self, manager: "SW360LicenseManager"):
+        self._manager = manager
+        self.docs: List[Dict[str, Any]] = []
+        self.results: List[Dict[str, Any]] = []
+
+    def __enter__(self) -> "_Batch":
+        if self._manager._active_batch() is not None:
+            raise Exception("batch() cannot be nested")
+        self._manager._batch_local.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._manager._batch_local.batch = None
+        # Discard queued writes if the with-block failed
+        if exc_type is None:
+            self.flush()
+
+    def add(self, doc: Dict[str, Any]):
+        """
+        Queue a document for the next flush.
+
+        Args:
+            doc: Document to create, update or delete
+        """
+        self.docs.append(doc)
+
+    def flush(self):
+        """
+        Write all queued documents with _bulk_docs.
+
+        Successfully written licenses are stored in the manager's cache
+        with their new revision, so reading them back is free.
+        """
+        docs, self.docs = self.docs, []
+        if not docs:
+            return
+
+        results = self._manager.bulk_write(docs)
+        self.results.extend(results)
+
+        for doc, result in zip(docs, results):
+            if result.get("ok") and not doc.get("_deleted"):
+                self._manager._cache_put(
+                    ("id", result["id"]),
+                    dict(doc, _id=result["id"], _rev=result["rev"])
+                )
+
 
 class SW360LicenseManager:
     """
@@ -36,14 +306,113 @@ class SW360LicenseManager:
             text="Permission is hereby granted...",
             osi_approved=True
         )
+
+        # Release pooled connections when done
+        manager.close()
+
+    The manager keeps HTTP connections to CouchDB open between calls
+    (keep-alive), so it can also be used as a context manager:
+
+        with SW360LicenseManager() as manager:
+            licenses = manager.list_licenses()
     """
 
+    # Fields returned by list_licenses() unless others are requested; the
+    # potentially large license text is left out
+    SUMMARY_FIELDS = ("_id", "_rev", "type", "shortName", "fullName", "OSIApproved", "checked")
+
+    # Maximum number of idle keep-alive connections kept in the pool
+    POOL_MAXSIZE = 8
+
+    # Maximum number of cached get_license()/find_by_short_name() results
+    CACHE_MAXSIZE = 128
+
+    # Maximum number of cached read responses, and the number of seconds
+    # they are reused for (see cache_ttl)
+    RESPONSE_CACHE_MAXSIZE = 256
+    RESPONSE_CACHE_TTL = 5.0
+
+    # POST endpoints that only read data; their responses may be cached
+    _READ_ONLY_POSTS = frozenset(("/_find", "/_bulk_get"))
+
+    # Number of bytes read from the socket at a time when streaming
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Request bodies larger than this many bytes are sent gzip-compressed
+    GZIP_MIN_SIZE = 1024
+
+    # Maximum number of documents sent in one _bulk_docs request
+    BULK_CHUNK_SIZE = 500
+
+    # Design document with the views used for lookups, counts and status
+    # filters. by_status keys every license by [OSIApproved, checked];
+    # licenses without those fields are treated as False. by_short_name
+    # keys licenses by their SPDX identifier. The patch update function
+    # merges a partial document into the stored one on the server.
+    _DESIGN_DOC_ID = "_design/licenses"
+    _DESIGN_DOC = {
+        "language": "javascript",
+        "views": {
+            "by_status": {
+                "map": (
+                    "function (doc) {"
+                    " if (doc.type === 'license') {"
+                    " emit([doc.OSIApproved === true, doc.checked === true], 1);"
+                    " } }"
+                ),
+                "reduce": "_count"
+            },
+            "by_short_name": {
+                "map": (
+                    "function (doc) {"
+                    " if (doc.type === 'license') {"
+                    " emit(doc.shortName, {_id: doc._id, _rev: doc._rev});"
+                    " } }"
+                )
+            }
+        },
+        "updates": {
+            "patch": (
+                "function (doc, req) {"
+                " if (!doc) { return [null, {code: 404, json: {error: 'not_found', reason: 'missing'}}]; }"
+                " var fields = JSON.parse(req.body);"
+                " for (var key in fields) {"
+                " if (key.charAt(0) !== '_') { doc[key] = fields[key]; }"
+                " }"
+                " return [doc, {json: {ok: true, id: doc._id}}]; }"
+            )
+        }
+    }
+
+    # Mango selectors used with _find(). The mapping is read-only and the
+    # selector dicts are shared, so they must not be modified by callers.
+    _SELECTORS = MappingProxyType({
+        "all": {"type": "license"}
+    })
+
+    # by_status view parameters for the status filters, keyed like
+    # _SELECTORS
+    _STATUS_VIEWS = MappingProxyType({
+        "osi": {"startkey": [True], "endkey": [True, {}]},
+        "checked": {"keys": [[False, True], [True, True]]},
+        "unchecked": {"keys": [[False, False], [True, False]]}
+    })
+
+    # Mango index narrowing search_licenses() queries to license documents
+    _SEARCH_INDEX = {
+        "index": {"fields": ["type"]},
+        "ddoc": "license-search",
+        "name": "by-type",
+        "type": "json"
+    }
+
     def __init__(
         self,
         url: str = "http://localhost:5984",
         username: str = "admin",
         password: str = "password",
-        database: str = "sw360db"
+        database: str = "sw360db",
+        cache: bool = True
     ):
         """
         Initialize the SW360 License Manager.
@@ -53,15 +422,300 @@ class SW360LicenseManager:
             username: CouchDB username (default: admin)
             password: CouchDB password (default: password)
             database: Database name (default: sw360db)
+            cache: Memoize get_license() and find_by_short_name() results
+                (default: True). Entries are invalidated when this manager
+                writes the license; changes made by other clients are not
+                seen until clear_cache() is called. Also enables the short
+                lived response cache, see cache_ttl.
+
+        Attributes:
+            cache_ttl: Seconds for which GET and Mango query responses are
+                reused (default: RESPONSE_CACHE_TTL, 0 when cache is
+                False). Any write made by this manager drops the cached
+                responses. Set to 0 to disable the response cache.
         """
         self.url = url.rstrip('/')
         self.database = database
         self.db_url = f"{self.url}/{self.database}"
 
-        # Create basic auth header
-        credentials = f"{username}:{password}"
-        encoded_credentials = b64encode(credentials.encode('utf-8')).decode('ascii')
-        self.auth_header = f"Basic {encoded_credentials}"
+        # Parse the server URL once; requests only need the path
+        parts = urllib.parse.urlsplit(self.url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._base_path = parts.path
+        self._db_path = f"{parts.path}/{self.database}"
+
+        # Create basic auth header (encoded once per set of credentials)
+        key = (username, password)
+        self.auth_header = _AUTH_CACHE.get(key)
+        if self.auth_header is None:
+            credentials = f"{username}:{password}"
+            encoded_credentials = b64encode(credentials.encode('utf-8')).decode('ascii')
+            self.auth_header = _AUTH_CACHE.setdefault(key, f"Basic {encoded_credentials}")
+
+        # Request headers never change for the lifetime of the manager
+        self._headers = {
+            "Authorization": self.auth_header,
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip"
+        }
+        self._headers_gzip = dict(self._headers, **{"Content-Encoding": "gzip"})
+        self._headers_get = {
+            "Authorization": self.auth_header,
+            "Accept-Encoding": "gzip"
+        }
+
+        # Pool of idle keep-alive connections, reused across requests
+        self._pool: List[http.client.HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+
+        # Memoized license lookups, keyed by ("id", license_id) or
+        # ("short_name", short_name, include_docs)
+        self._cache: Optional[_LRUCache] = _LRUCache(self.CACHE_MAXSIZE) if cache else None
+
+        # Raw bodies of recent read responses, keyed by
+        # (method, endpoint, request data)
+        self.cache_ttl = self.RESPONSE_CACHE_TTL if cache else 0
+        self._resp_cache = _TTLCache(self.RESPONSE_CACHE_MAXSIZE)
+
+        # State for client-side monotonic document IDs, see _next_monotonic_id()
+        self._id_token = secrets.token_hex(4)
+        self._id_counter = itertools.count()
+
+        # Writes queued inside a batch() block, per thread: the 'batch'
+        # attribute is only set on the thread that opened the block
+        self._batch_local = threading.local()
+
+        # Whether the server supports Mango queries for search_licenses()
+        # (None until the search index has been created)
+        self._mango_search: Optional[bool] = None
+
+        # Whether _design/licenses has been checked/created on the server
+        self._design_doc_ready = False
+
+    def __enter__(self) -> "SW360LicenseManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close all pooled connections to CouchDB.
+
+        The manager can still be used afterwards; new connections are
+        opened on demand.
+        """
+        with self._pool_lock:
+            connections, self._pool = self._pool, []
+        for conn in connections:
+            conn.close()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """
+        Open a new connection to the CouchDB server.
+
+        Returns:
+            HTTP(S) connection for the configured server URL
+        """
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port)
+        return http.client.HTTPConnection(self._host, self._port)
+
+    def _acquire_connection(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take an idle connection from the pool, or open a new one.
+
+        Returns:
+            Tuple of (connection, reused) where reused is True if the
+            connection was taken from the pool
+        """
+        with self._pool_lock:
+            if self._pool:
+                return self._pool.pop(), True
+        return self._new_connection(), False
+
+    def _release_connection(self, conn: http.client.HTTPConnection):
+        """
+        Return a connection to the pool once its response has been read.
+
+        Args:
+            conn: Connection to keep alive for the next request
+        """
+        with self._pool_lock:
+            if len(self._pool) < self.POOL_MAXSIZE:
+                self._pool.append(conn)
+                return
+        conn.close()
+
+    def _urlopen(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send a request over a pooled connection.
+
+        The caller must read the response and then either return the
+        connection with _release_connection() or close it.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: Request path on the server (e.g., "/sw360db/_find")
+            body: Encoded request body
+            headers: Request headers (default: authorization only)
+
+        Returns:
+            Tuple of (connection, response)
+        """
+        conn, reused = self._acquire_connection()
+        try:
+            conn.request(method, path, body=body, headers=headers or self._headers_get)
+            return conn, conn.getresponse()
+        except ConnectionError:
+            conn.close()
+            if not reused:
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        # The server closed an idle keep-alive connection; retry once on
+        # a fresh one
+        conn = self._new_connection()
+        try:
+            conn.request(method, path, body=body, headers=headers or self._headers_get)
+            return conn, conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+
+    def _request_raw(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        """
+        Send a request and read the whole response body.
+
+        Args:
+            method: HTTP method (GET, HEAD, POST, PUT, DELETE)
+            path: Request path on the server
+            body: Encoded request body
+            headers: Request headers
+
+        Returns:
+            Tuple of (response, body); the response gives access to the
+            status and headers
+
+        Raises:
+            CouchDBError: If the server responds with an HTTP error
+        """
+        conn, response = self._urlopen(method, path, body, headers)
+        try:
+            response_data = response.read()
+        except Exception:
+            conn.close()
+            raise
+        self._release_connection(conn)
+
+        if response.getheader("Content-Encoding") == "gzip":
+            response_data = gzip.decompress(response_data)
+        if response.status >= 400:
+            raise CouchDBError(response.status, response_data.decode('utf-8', 'replace'))
+        return response, response_data
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        Send a request and decode the JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: Request path on the server
+            body: Encoded request body
+            headers: Request headers
+
+        Returns:
+            Decoded response data
+
+        Raises:
+            CouchDBError: If the server responds with an HTTP error
+        """
+        _, response_data = self._request_raw(method, path, body, headers)
+        return _json_loads(response_data)
+
+    def _encode_body(
+        self,
+        data: Optional[Dict],
+        compress: bool = True
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """
+        Encode a JSON request body, compressing it if it is large.
+
+        Args:
+            data: Request body data
+            compress: Whether large bodies may be gzip-compressed. Update
+                functions get the raw request body, so it must be False
+                for _update requests.
+
+        Returns:
+            Tuple of (encoded body, request headers)
+        """
+        if not data:
+            return None, self._headers
+
+        body = _json_dumps(data)
+        if compress and len(body) > self.GZIP_MIN_SIZE:
+            return gzip.compress(body), self._headers_gzip
+        return body, self._headers
+
+    def _make_raw_request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        compress: bool = True
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        """
+        Make an HTTP request to CouchDB without decoding the response.
+
+        Args:
+            endpoint: API endpoint (e.g., "/document_id")
+            method: HTTP method (GET, HEAD, POST, PUT, DELETE)
+            data: Request body data (will be JSON encoded)
+            compress: Whether a large body may be sent gzip-compressed
+                (see _encode_body())
+
+        Returns:
+            Tuple of (response, body)
+
+        Raises:
+            CouchDBError: If CouchDB responds with an HTTP error
+            Exception: If the request could not be sent
+        """
+        request_data, headers = self._encode_body(data, compress)
+
+        try:
+            return self._request_raw(method, self._db_path + endpoint, request_data, headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise Exception(f"Request failed: {str(e)}")
+        finally:
+            # Cached responses may be outdated by any write, even a failed one
+            if method not in ("GET", "HEAD") and not (
+                method == "POST" and endpoint in self._READ_ONLY_POSTS
+            ):
+                self._resp_cache.clear()
 
     def _make_request(
         self,
@@ -72,6 +726,9 @@ class SW360LicenseManager:
         """
         Make an HTTP request to CouchDB.
 
+        GET requests and Mango queries without a bookmark are answered from
+        the response cache for cache_ttl seconds.
+
         Args:
             endpoint: API endpoint (e.g., "/_find", "/document_id")
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -81,36 +738,94 @@ class SW360LicenseManager:
             Response data as dictionary
 
         Raises:
-            Exception: If request fails
+            CouchDBError: If CouchDB responds with an HTTP error
+            Exception: If the request could not be sent
         """
-        url = f"{self.db_url}{endpoint}"
+        key = None
+        if self.cache_ttl > 0 and (
+            method == "GET"
+            or (endpoint == "/_find" and not (data and data.get("bookmark")))
+        ):
+            key = (method, endpoint, json.dumps(data, sort_keys=True))
+            response_data = self._resp_cache.get(key)
+            if response_data is not None:
+                return _json_loads(response_data)
+            generation = self._resp_cache.generation
+
+        _, response_data = self._make_raw_request(endpoint, method, data)
+        if key is not None:
+            # The raw body is kept so every hit decodes a fresh copy. It is
+            # dropped if a write cleared the cache while it was in flight.
+            self._resp_cache.put(key, response_data, self.cache_ttl, generation)
+        try:
+            return _json_loads(response_data)
+        except ValueError as e:
+            raise Exception(f"Request failed: {str(e)}")
 
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json"
-        }
+    def _stream_find(self, query: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Run a Mango query and yield the documents while they are received.
 
-        request_data = None
-        if data:
-            request_data = json.dumps(data).encode('utf-8')
+        Unlike _make_request(), the response is parsed incrementally from
+        the socket, so the raw body is never held in memory as a whole.
 
-        request = urllib.request.Request(
-            url,
-            data=request_data,
-            headers=headers,
-            method=method
-        )
+        Args:
+            query: Mango query (selector, fields, limit, ...)
+
+        Yields:
+            Matching documents
+
+        Raises:
+            CouchDBError: If CouchDB responds with an HTTP error
+            Exception: If the request could not be sent
+        """
+        body, headers = self._encode_body(query)
 
         try:
-            with urllib.request.urlopen(request) as response:
-                response_data = response.read().decode('utf-8')
-                return json.loads(response_data)
-        except urllib.error.HTTPError as e:
-            error_data = e.read().decode('utf-8')
-            raise Exception(f"HTTP {e.code} Error: {error_data}")
-        except Exception as e:
+            conn, response = self._urlopen("POST", f"{self._db_path}/_find", body, headers)
+        except (OSError, http.client.HTTPException) as e:
             raise Exception(f"Request failed: {str(e)}")
 
+        complete = False
+        try:
+            gzipped = response.getheader("Content-Encoding") == "gzip"
+
+            if response.status >= 400:
+                # The connection is closed rather than reused after an error
+                error_data = response.read()
+                if gzipped:
+                    error_data = gzip.decompress(error_data)
+                raise CouchDBError(response.status, error_data.decode('utf-8', 'replace'))
+
+            text_decoder = codecs.getincrementaldecoder('utf-8')()
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+
+            def chunks() -> Iterator[str]:
+                while True:
+                    data = response.read(self.STREAM_CHUNK_SIZE)
+                    if not data:
+                        if decompressor is not None:
+                            yield text_decoder.decode(decompressor.flush())
+                        yield text_decoder.decode(b"", final=True)
+                        return
+                    if decompressor is not None:
+                        data = decompressor.decompress(data)
+                    yield text_decoder.decode(data)
+
+            try:
+                yield from _iter_json_array(chunks(), "docs")
+                # Drain the rest of the body (bookmark, warnings)
+                response.read()
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                raise Exception(f"Request failed: {str(e)}")
+            complete = True
+        finally:
+            # A partially read response leaves the connection unusable
+            if complete:
+                self._release_connection(conn)
+            else:
+                conn.close()
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test connection to CouchDB server.
@@ -118,12 +833,7 @@ class SW360LicenseManager:
         Returns:
             Server information
         """
-        request = urllib.request.Request(
-            self.url,
-            headers={"Authorization": self.auth_header}
-        )
-        with urllib.request.urlopen(request) as response:
-            return json.loads(response.read().decode('utf-8'))
+        return self._request("GET", self._base_path or "/", headers=self._headers_get)
 
     def list_databases(self) -> List[str]:
         """
@@ -132,29 +842,227 @@ class SW360LicenseManager:
         Returns:
             List of database names
         """
-        request = urllib.request.Request(
-            f"{self.url}/_all_dbs",
-            headers={"Authorization": self.auth_header}
-        )
-        with urllib.request.urlopen(request) as response:
-            return json.loads(response.read().decode('utf-8'))
+        return self._request("GET", f"{self._base_path}/_all_dbs", headers=self._headers_get)
 
-    def list_licenses(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def list_licenses(
+        self,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = SUMMARY_FIELDS
+    ) -> List[Dict[str, Any]]:
         """
         List all licenses in the database.
 
         Args:
             limit: Maximum number of licenses to return (None = all)
+            fields: Fields to return for each license (default:
+                SUMMARY_FIELDS, i.e. everything except the license text).
+                Pass None to get the full documents, or e.g. ["text"].
 
         Returns:
             List of license documents
+
+        Note:
+            Without a limit, the licenses are fetched page by page like
+            in list_licenses_iter(); CouchDB would otherwise stop at its
+            default limit of 25 documents.
+
+        Example:
+            for license in manager.list_licenses():
+                print(license["shortName"], license["fullName"])
+
+            # Full documents, including the license text
+            backup = manager.list_licenses(fields=None)
+        """
+        return list(self._find(self._SELECTORS["all"], fields=fields, limit=limit))
+
+    def list_licenses_iter(
+        self,
+        page_size: int = 500,
+        fields: Optional[Sequence[str]] = SUMMARY_FIELDS
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all licenses, fetching them in pages.
+
+        Pages are requested with Mango bookmarks, so memory use is bounded
+        by the page size. The next page is fetched in the background while
+        the current one is being processed.
+
+        Args:
+            page_size: Number of licenses per request (default: 500)
+            fields: Fields to return for each license (see list_licenses())
+
+        Yields:
+            License documents
+
+        Example:
+            for license in manager.list_licenses_iter(page_size=1000):
+                process(license)
+        """
+        return self._find(self._SELECTORS["all"], fields=fields, page_size=page_size)
+
+    def _find(
+        self,
+        selector: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        page_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run a Mango query and iterate over the matching documents.
+
+        With a limit, a single streamed request is made. Without one, the
+        documents are fetched page by page with bookmarks, the next page
+        being requested in the background while the current one is
+        consumed.
+
+        Args:
+            selector: Mango selector, e.g. one of _SELECTORS
+            fields: Fields to return for each document (None = all)
+            limit: Maximum number of documents to return (None = all)
+            page_size: Number of documents per request when paging
+
+        Returns:
+            Iterator over the matching documents
         """
-        query = {"selector": {"type": "license"}}
         if limit:
-            query["limit"] = limit
+            query = {"selector": selector, "limit": limit}
+            if fields:
+                query["fields"] = list(fields)
+            return self._stream_find(query)
+        return self._find_pages(selector, fields, page_size)
+
+    def _find_pages(
+        self,
+        selector: Dict[str, Any],
+        fields: Optional[Sequence[str]],
+        page_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Page through a Mango query with bookmarks (see _find()).
+        """
+        query = {"selector": selector, "limit": page_size}
+        if fields:
+            query["fields"] = list(fields)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sw360-page") as executor:
+            future = executor.submit(self._make_request, "/_find", "POST", query)
+            while future is not None:
+                result = future.result()
+                docs = result.get("docs", [])
+                bookmark = result.get("bookmark")
+
+                future = None
+                if len(docs) == page_size and bookmark and bookmark != query.get("bookmark"):
+                    query = dict(query, bookmark=bookmark)
+                    future = executor.submit(self._make_request, "/_find", "POST", query)
+
+                yield from docs
+
+    def clear_cache(self):
+        """
+        Drop all memoized get_license() and find_by_short_name() results
+        and all cached responses.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+        self._resp_cache.clear()
+
+    def _cached(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Return a memoized lookup result, calling fetch() on a cache miss.
+
+        Args:
+            key: Cache key
+            fetch: Function performing the actual request
+
+        Returns:
+            A copy of the cached value, so callers may modify it freely
+        """
+        if self._cache is None:
+            return fetch()
+
+        value = self._cache.get(key)
+        if value is None:
+            # A write by another thread while fetch() runs makes the result
+            # possibly outdated; put() then skips storing it
+            generation = self._cache.generation
+            value = fetch()
+            self._cache.put(key, value, generation)
+        return copy.deepcopy(value)
+
+    def _cache_put(self, key: Hashable, value: Any):
+        """
+        Store a lookup result in the cache, if caching is enabled.
+
+        Args:
+            key: Cache key
+            value: Result to memoize
+        """
+        if self._cache is not None:
+            self._cache.put(key, value)
+
+    def _invalidate(self, license_id: Optional[str] = None, short_name: Optional[str] = None):
+        """
+        Drop cached lookups that may be affected by a write.
+
+        Args:
+            license_id: ID of the written license
+            short_name: Short name of the written license
+        """
+        if self._cache is None:
+            return
+
+        def affected(key: Hashable, value: Any) -> bool:
+            if key[0] == "id":
+                return key[1] == license_id
+            # The license may also be listed under its previous short name
+            return key[1] == short_name or (
+                license_id is not None and any(d.get("_id") == license_id for d in value)
+            )
+
+        # Always bumps the generation, also discarding lookups in flight
+        self._cache.pop_matching(affected)
+
+    def _next_monotonic_id(self) -> str:
+        """
+        Generate a new, increasing document ID.
+
+        IDs have the form "<nanosecond timestamp>-<manager token>-<counter>",
+        e.g. "01731254400123456789-9f86d081-000042". They sort in creation
+        order, so CouchDB appends new documents to the right edge of its
+        B-tree instead of rewriting random inner nodes as it does for
+        random UUIDs. The random token keeps IDs from different managers
+        apart when the clock is coarse.
+
+        Returns:
+            Document ID
+        """
+        return f"{time.time_ns():020d}-{self._id_token}-{next(self._id_counter):06d}"
+
+    @staticmethod
+    def _build_license_doc(
+        full_name: str,
+        short_name: str,
+        text: str = "",
+        osi_approved: bool = False,
+        checked: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Build a license document from create_license() style arguments.
 
-        result = self._make_request("/_find", method="POST", data=query)
-        return result.get("docs", [])
+        Returns:
+            License document ready to be stored in CouchDB
+        """
+        return {
+            "type": "license",
+            "fullName": full_name,
+            "shortName": short_name,
+            "text": text,
+            "OSIApproved": osi_approved,
+            "checked": checked,
+            **kwargs
+        }
 
     def create_license(
         self,
@@ -164,7 +1072,7 @@ class SW360LicenseManager:
         osi_approved: bool = False,
         checked: bool = False,
         **kwargs
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
         Create a new license in the database.
 
@@ -174,10 +1082,19 @@ class SW360LicenseManager:
             text: Full license text
             osi_approved: Whether the license is OSI approved
             checked: Whether the license has been reviewed
-            **kwargs: Additional fields to include
+            **kwargs: Additional fields to include. Pass '_id' to choose
+                the document ID yourself.
 
         Returns:
-            Response containing 'ok', 'id', and 'rev'
+            Response containing 'ok', 'id', and 'rev'. Inside batch() the
+            document is queued instead and None is returned.
+
+        Note:
+            Unless '_id' is given, the ID is generated on the client and
+            increases with every license created (see _next_monotonic_id()).
+            Such IDs make inserts cheaper for CouchDB, but they reveal the
+            creation time and differ in shape from the 32 character
+            UUIDs CouchDB assigns itself.
 
         Example:
             result = manager.create_license(
@@ -190,16 +1107,21 @@ class SW360LicenseManager:
             print(f"Created license with ID: {result['id']}")
         """
         license_doc = {
-            "type": "license",
-            "fullName": full_name,
-            "shortName": short_name,
-            "text": text,
-            "OSIApproved": osi_approved,
-            "checked": checked,
-            **kwargs
+            "_id": kwargs.pop("_id", None) or self._next_monotonic_id(),
+            **self._build_license_doc(
+                full_name, short_name, text, osi_approved, checked, **kwargs
+            )
         }
 
-        return self._make_request("", method="POST", data=license_doc)
+        batch = self._active_batch()
+        if batch is not None:
+            batch.add(license_doc)
+            return None
+
+        try:
+            return self._make_request("", method="POST", data=license_doc)
+        finally:
+            self._invalidate(short_name=short_name)
 
     def get_license(self, license_id: str) -> Dict[str, Any]:
         """
@@ -209,9 +1131,9 @@ class SW360LicenseManager:
             license_id: The license document ID
 
         Returns:
-            License document
+            License document (served from the cache if it was fetched before)
         """
-        return self._make_request(f"/{license_id}")
+        return self._cached(("id", license_id), lambda: self._make_request(f"/{license_id}"))
 
     def update_license(
         self,
@@ -223,7 +1145,7 @@ class SW360LicenseManager:
         osi_approved: bool = False,
         checked: bool = False,
         **kwargs
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
         Update an existing license.
 
@@ -238,7 +1160,8 @@ class SW360LicenseManager:
             **kwargs: Additional fields to include
 
         Returns:
-            Response containing 'ok', 'id', and 'rev'
+            Response containing 'ok', 'id', and 'rev'. Inside batch() the
+            update is queued instead and None is returned.
 
         Example:
             license = manager.get_license("license_id_here")
@@ -253,18 +1176,80 @@ class SW360LicenseManager:
         """
         license_doc = {
             "_rev": rev,
-            "type": "license",
-            "fullName": full_name,
-            "shortName": short_name,
-            "text": text,
-            "OSIApproved": osi_approved,
-            "checked": checked,
-            **kwargs
+            **self._build_license_doc(
+                full_name, short_name, text, osi_approved, checked, **kwargs
+            )
         }
 
-        return self._make_request(f"/{license_id}", method="PUT", data=license_doc)
+        batch = self._active_batch()
+        if batch is not None:
+            batch.add({"_id": license_id, **license_doc})
+            return None
+
+        try:
+            return self._make_request(f"/{license_id}", method="PUT", data=license_doc)
+        finally:
+            self._invalidate(license_id, short_name)
+
+    def get_rev(self, license_id: str) -> str:
+        """
+        Get the current revision of a license without fetching it.
+
+        Sends a HEAD request and reads the revision from the ETag header.
+
+        Args:
+            license_id: The license document ID
+
+        Returns:
+            Current revision (e.g., "3-9a1b...")
+        """
+        response, _ = self._make_raw_request(f"/{license_id}", method="HEAD")
+        return response.getheader("ETag", "").strip('"')
+
+    def update_license_fields(self, license_id: str, **fields) -> Dict[str, Any]:
+        """
+        Change selected fields of a license on the server.
+
+        Only the given fields are sent; CouchDB merges them into the stored
+        document with the patch update function of _design/licenses. No
+        revision is needed and the license text is not sent back and forth.
+        Fields starting with '_' are ignored. Unlike update_license(), this
+        always writes immediately, even inside batch().
+
+        Args:
+            license_id: The license document ID
+            **fields: Fields to set, using the stored field names
+                (e.g., checked=True, OSIApproved=False)
+
+        Returns:
+            Response containing 'ok', 'id', and 'rev'
+
+        Example:
+            manager.update_license_fields(license_id, checked=True)
+        """
+        if not fields:
+            raise ValueError("update_license_fields() needs at least one field")
+
+        self._ensure_design_doc()
+        try:
+            response, _ = self._make_raw_request(
+                f"/{self._DESIGN_DOC_ID}/_update/patch/{license_id}",
+                method="PUT",
+                data=fields,
+                # The update function parses req.body itself; CouchDB does
+                # not decompress it
+                compress=False
+            )
+        finally:
+            self._invalidate(license_id, fields.get("shortName"))
+
+        return {
+            "ok": True,
+            "id": license_id,
+            "rev": response.getheader("X-Couch-Update-NewRev")
+        }
 
-    def delete_license(self, license_id: str, rev: str) -> Dict[str, Any]:
+    def delete_license(self, license_id: str, rev: str) -> Optional[Dict[str, Any]]:
         """
         Delete a license from the database.
 
@@ -273,31 +1258,286 @@ class SW360LicenseManager:
             rev: Current revision number (required by CouchDB)
 
         Returns:
-            Response containing 'ok', 'id', and 'rev'
+            Response containing 'ok', 'id', and 'rev'. Inside batch() the
+            deletion is queued instead and None is returned.
 
         Warning:
             This permanently deletes the license document!
         """
-        return self._make_request(f"/{license_id}?rev={rev}", method="DELETE")
+        batch = self._active_batch()
+        if batch is not None:
+            batch.add({"_id": license_id, "_rev": rev, "_deleted": True})
+            return None
+
+        try:
+            return self._make_request(f"/{license_id}?rev={rev}", method="DELETE")
+        finally:
+            self._invalidate(license_id)
+
+    def bulk_write(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Write many documents with CouchDB's _bulk_docs endpoint.
+
+        Documents are sent in chunks of BULK_CHUNK_SIZE, so a large import
+        costs a handful of requests instead of one request per document.
+
+        Args:
+            docs: Documents to create, update (with '_id' and '_rev') or
+                delete (with '_id', '_rev' and '_deleted': True)
 
-    def find_by_short_name(self, short_name: str) -> List[Dict[str, Any]]:
+        Returns:
+            One result per document, in order. Successful writes contain
+            'ok', 'id' and 'rev'; failed ones contain 'id', 'error' and
+            'reason' (e.g., a 'conflict' for a stale revision).
+        """
+        results = []
+        try:
+            for start in range(0, len(docs), self.BULK_CHUNK_SIZE):
+                chunk = docs[start:start + self.BULK_CHUNK_SIZE]
+                results.extend(
+                    self._make_request("/_bulk_docs", method="POST", data={"docs": chunk})
+                )
+        finally:
+            for doc in docs:
+                self._invalidate(doc.get("_id"), doc.get("shortName"))
+        return results
+
+    def bulk_create_licenses(self, licenses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many licenses in as few requests as possible.
+
+        Args:
+            licenses: List of create_license() keyword arguments, e.g.
+                [{"full_name": "MIT License", "short_name": "MIT"}, ...]
+
+        Returns:
+            One _bulk_docs result per license (see bulk_write())
+
+        Note:
+            Licenses without an '_id' get a monotonic client-side ID, as
+            with create_license().
+
+        Example:
+            results = manager.bulk_create_licenses([
+                {"full_name": "MIT License", "short_name": "MIT", "osi_approved": True},
+                {"full_name": "Apache License 2.0", "short_name": "Apache-2.0"},
+            ])
+            failed = [r for r in results if "error" in r]
+        """
+        docs = []
+        for lic in licenses:
+            doc = self._build_license_doc(**lic)
+            docs.append({"_id": doc.pop("_id", None) or self._next_monotonic_id(), **doc})
+        return self.bulk_write(docs)
+
+    def bulk_update_licenses(self, licenses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Update many licenses in as few requests as possible.
+
+        Args:
+            licenses: Full license documents including their current '_id'
+                and '_rev', e.g. as returned by get_license()
+
+        Returns:
+            One _bulk_docs result per license (see bulk_write())
+
+        Example:
+            licenses = manager.get_unchecked_licenses()
+            for license in licenses:
+                license["checked"] = True
+            manager.bulk_update_licenses(licenses)
+        """
+        return self.bulk_write(licenses)
+
+    def bulk_delete_licenses(self, id_rev_pairs: Iterable[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Delete many licenses in as few requests as possible.
+
+        Args:
+            id_rev_pairs: (license_id, rev) tuples of the licenses to delete
+
+        Returns:
+            One _bulk_docs result per license (see bulk_write())
+
+        Warning:
+            This permanently deletes the license documents!
+        """
+        return self.bulk_write([
+            {"_id": license_id, "_rev": rev, "_deleted": True}
+            for license_id, rev in id_rev_pairs
+        ])
+
+    def bulk_get(self, ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch the current version of many documents with _bulk_get.
+
+        Args:
+            ids: Document IDs to fetch
+
+        Returns:
+            Dictionary mapping each found ID to its document; IDs that do
+            not exist (or were deleted) are left out
+        """
+        ids = list(ids)
+        docs = {}
+        for start in range(0, len(ids), self.BULK_CHUNK_SIZE):
+            chunk = ids[start:start + self.BULK_CHUNK_SIZE]
+            result = self._make_request(
+                "/_bulk_get",
+                method="POST",
+                data={"docs": [{"id": doc_id} for doc_id in chunk]}
+            )
+            for entry in result.get("results", []):
+                for version in entry.get("docs", []):
+                    if "ok" in version:
+                        docs[entry["id"]] = version["ok"]
+        return docs
+
+    def bulk_mark_checked(self, ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Mark many licenses as reviewed.
+
+        Fetches the current revisions with one _bulk_get request and writes
+        all changes with one _bulk_docs request, instead of one GET and
+        one PUT per license.
+
+        Args:
+            ids: IDs of the licenses to mark as checked
+
+        Returns:
+            One _bulk_docs result per license found (see bulk_write())
+
+        Example:
+            unchecked = manager.get_unchecked_licenses()
+            results = manager.bulk_mark_checked(lic["_id"] for lic in unchecked)
+        """
+        licenses = list(self.bulk_get(ids).values())
+        for license in licenses:
+            license["checked"] = True
+        return self.bulk_write(licenses)
+
+    def _active_batch(self) -> Optional[_Batch]:
+        """
+        Return the batch opened on the current thread, if any.
+        """
+        return getattr(self._batch_local, "batch", None)
+
+    def batch(self) -> _Batch:
+        """
+        Queue writes and send them with one _bulk_docs request.
+
+        Inside the with-block create_license(), update_license() and
+        delete_license() return None instead of writing immediately. Only
+        calls made on the thread that opened the batch are queued; other
+        threads sharing the manager keep writing directly. The
+        queued documents are written when the block exits; if the block
+        raises, nothing is written. Per-document results (including
+        conflicts) are available from the batch's 'results' attribute,
+        in the order the calls were made.
+
+        Returns:
+            Context manager collecting the queued writes
+
+        Example:
+            with manager.batch() as batch:
+                for lic in licenses_data:
+                    manager.create_license(**lic)
+            print(f"Created {sum(1 for r in batch.results if r.get('ok'))} licenses")
+        """
+        return _Batch(self)
+
+    def find_by_short_name(self, short_name: str, include_docs: bool = True) -> List[Dict[str, Any]]:
         """
         Find licenses by short name (SPDX identifier).
 
+        Looks the key up directly in the by_short_name view.
+
         Args:
             short_name: License short name (e.g., "MIT", "Apache-2.0")
+            include_docs: If True, return the full documents; if False,
+                return only '_id', '_rev' and 'shortName' of each match,
+                which is enough for existence checks
 
         Returns:
-            List of matching license documents
+            List of matching licenses (served from the cache if the same
+            short name was looked up before)
         """
-        query = {
-            "selector": {
-                "type": "license",
-                "shortName": short_name
-            }
-        }
-        result = self._make_request("/_find", method="POST", data=query)
-        return result.get("docs", [])
+        def fetch() -> List[Dict[str, Any]]:
+            if include_docs:
+                return self._view_docs("by_short_name", key=short_name)
+            rows = self._query_view("by_short_name", key=short_name).get("rows", [])
+            return [dict(row["value"], shortName=row["key"]) for row in rows]
+
+        return self._cached(("short_name", short_name, include_docs), fetch)
+
+    def _ensure_design_doc(self):
+        """
+        Create or upgrade the _design/licenses document once per manager.
+
+        Raises:
+            CouchDBError: If the design document cannot be read or written
+        """
+        if self._design_doc_ready:
+            return
+
+        try:
+            current = self._make_request(f"/{self._DESIGN_DOC_ID}")
+        except CouchDBError as e:
+            if e.status != 404:
+                raise
+            current = None
+
+        # Views and update functions added by others to the shared design
+        # document are kept; only the entries defined here are compared
+        # and overwritten
+        design_doc = dict(current or {})
+        for key, value in self._DESIGN_DOC.items():
+            if isinstance(value, dict):
+                existing = design_doc.get(key) or {}
+                value = {**existing, **value}
+            design_doc[key] = value
+
+        if design_doc != current:
+            try:
+                self._make_request(f"/{self._DESIGN_DOC_ID}", method="PUT", data=design_doc)
+            except CouchDBError as e:
+                # Another client updated the design document first
+                if e.status != 409:
+                    raise
+
+        self._design_doc_ready = True
+
+    def _query_view(self, view: str, **params) -> Dict[str, Any]:
+        """
+        Query a view of the _design/licenses document.
+
+        Args:
+            view: View name (e.g., "by_status")
+            **params: View query parameters (e.g., key, startkey, reduce);
+                values are JSON encoded
+
+        Returns:
+            View response containing 'rows'
+        """
+        self._ensure_design_doc()
+        query = urllib.parse.urlencode(
+            {k: json.dumps(v, separators=(",", ":")) for k, v in params.items()}
+        )
+        return self._make_request(f"/{self._DESIGN_DOC_ID}/_view/{view}?{query}")
+
+    def _view_docs(self, view: str, **params) -> List[Dict[str, Any]]:
+        """
+        Get the documents emitted by a view.
+
+        Args:
+            view: View name
+            **params: View query parameters
+
+        Returns:
+            List of documents
+        """
+        result = self._query_view(view, reduce=False, include_docs=True, **params)
+        return [row["doc"] for row in result.get("rows", [])]
 
     def get_osi_approved_licenses(self) -> List[Dict[str, Any]]:
         """
@@ -306,14 +1546,7 @@ class SW360LicenseManager:
         Returns:
             List of OSI approved license documents
         """
-        query = {
-            "selector": {
-                "type": "license",
-                "OSIApproved": True
-            }
-        }
-        result = self._make_request("/_find", method="POST", data=query)
-        return result.get("docs", [])
+        return self._view_docs("by_status", **self._STATUS_VIEWS["osi"])
 
     def get_checked_licenses(self) -> List[Dict[str, Any]]:
         """
@@ -322,14 +1555,7 @@ class SW360LicenseManager:
         Returns:
             List of checked license documents
         """
-        query = {
-            "selector": {
-                "type": "license",
-                "checked": True
-            }
-        }
-        result = self._make_request("/_find", method="POST", data=query)
-        return result.get("docs", [])
+        return self._view_docs("by_status", **self._STATUS_VIEWS["checked"])
 
     def get_unchecked_licenses(self) -> List[Dict[str, Any]]:
         """
@@ -338,28 +1564,61 @@ class SW360LicenseManager:
         Returns:
             List of unchecked license documents
         """
-        query = {
-            "selector": {
-                "type": "license",
-                "checked": False
-            }
-        }
-        result = self._make_request("/_find", method="POST", data=query)
-        return result.get("docs", [])
+        return self._view_docs("by_status", **self._STATUS_VIEWS["unchecked"])
 
     def count_licenses(self) -> int:
         """
         Count total number of licenses.
 
+        Uses the _count reduce of the by_status view, so only a single
+        number is transferred regardless of database size.
+
         Returns:
             Number of licenses in database
         """
-        query = {
-            "selector": {"type": "license"},
-            "fields": ["_id"]
-        }
-        result = self._make_request("/_find", method="POST", data=query)
-        return len(result.get("docs", []))
+        rows = self._query_view("by_status", reduce=True).get("rows", [])
+        return rows[0]["value"] if rows else 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get license statistics with a single request.
+
+        Groups the by_status view by [OSIApproved, checked], so CouchDB
+        returns at most four counts instead of the license documents.
+
+        Returns:
+            Dictionary with 'total', 'osi', 'checked' and 'unchecked' counts
+
+        Example:
+            stats = manager.get_stats()
+            print(f"{stats['unchecked']} of {stats['total']} licenses need review")
+        """
+        stats = {"total": 0, "osi": 0, "checked": 0, "unchecked": 0}
+        for row in self._query_view("by_status", reduce=True, group_level=2).get("rows", []):
+            osi_approved, checked = row["key"]
+            stats["total"] += row["value"]
+            if osi_approved:
+                stats["osi"] += row["value"]
+            stats["checked" if checked else "unchecked"] += row["value"]
+        return stats
+
+    def _ensure_search_index(self) -> bool:
+        """
+        Create the Mango index used by search_licenses() once per manager.
+
+        Returns:
+            True if the server supports Mango queries, False if it is an
+            older CouchDB without the /_index endpoint
+        """
+        if self._mango_search is None:
+            try:
+                self._make_request("/_index", method="POST", data=self._SEARCH_INDEX)
+                self._mango_search = True
+            except CouchDBError as e:
+                if e.status != 404:
+                    raise
+                self._mango_search = False
+        return self._mango_search
 
     def search_licenses(self, search_text: str, fields: List[str] = None) -> List[Dict[str, Any]]:
         """
@@ -373,24 +1632,182 @@ class SW360LicenseManager:
             List of matching license documents
 
         Note:
-            This performs a case-sensitive substring search.
-            For case-insensitive search, convert search_text to lowercase
-            and search in lowercase versions of fields.
+            This performs a case-insensitive substring search. Matching is
+            done by CouchDB with a Mango $regex query, so only matching
+            documents are transferred. On servers without Mango indexes the
+            licenses are fetched and filtered in Python instead.
         """
         if fields is None:
             fields = ["fullName", "shortName", "text"]
 
-        # Get all licenses and filter in Python (CouchDB has limited text search)
-        all_licenses = self.list_licenses()
-        results = []
+        if self._ensure_search_index():
+            pattern = "(?i)" + re.escape(search_text)
+            selector = dict(
+                self._SELECTORS["all"],
+                **{"$or": [{field: {"$regex": pattern}} for field in fields]}
+            )
+            return list(self._find(selector))
+
+        # Get all licenses and filter in Python. Like $regex, only string
+        # fields can match.
+        needle = search_text.lower()
+        fields = tuple(fields)
+        return [
+            license for license in self.list_licenses(fields=None)
+            if any(
+                isinstance(license.get(field), str) and needle in license[field].lower()
+                for field in fields
+            )
+        ]
 
-        for license in all_licenses:
-            for field in fields:
-                if field in license and search_text.lower() in str(license[field]).lower():
-                    results.append(license)
-                    break
 
-        return results
+class AsyncSW360LicenseManager:
+    """
+    asyncio interface to SW360LicenseManager for running queries concurrently.
+
+    Each call runs the corresponding SW360LicenseManager method in a worker
+    thread. The manager's connection pool is shared by the threads, so up
+    to POOL_MAXSIZE requests can be in flight at the same time.
+
+    Usage:
+        async with AsyncSW360LicenseManager() as manager:
+            total, osi, checked = await asyncio.gather(
+                manager.count_licenses(),
+                manager.get_osi_approved_licenses(),
+                manager.get_checked_licenses()
+            )
+    """
+
+    def __init__(
+        self,
+        manager: Optional[SW360LicenseManager] = None,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ):
+        """
+        Initialize the async license manager.
+
+        Args:
+            manager: Existing SW360LicenseManager to wrap; if omitted, one
+                is created from **kwargs
+            max_workers: Maximum number of concurrent requests
+                (default: SW360LicenseManager.POOL_MAXSIZE)
+            **kwargs: SW360LicenseManager arguments (url, username, ...)
+        """
+        self._owns_manager = manager is None
+        self.manager = manager or SW360LicenseManager(**kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.manager.POOL_MAXSIZE,
+            thread_name_prefix="sw360"
+        )
+
+    async def __aenter__(self) -> "AsyncSW360LicenseManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stop the worker threads, and close the wrapped manager's connections
+        if it was created by this object.
+        """
+        self._executor.shutdown(wait=True)
+        if self._owns_manager:
+            self.manager.close()
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking manager method in a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def test_connection(self) -> Dict[str, Any]:
+        """See SW360LicenseManager.test_connection()."""
+        return await self._run(self.manager.test_connection)
+
+    async def list_databases(self) -> List[str]:
+        """See SW360LicenseManager.list_databases()."""
+        return await self._run(self.manager.list_databases)
+
+    async def list_licenses(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.list_licenses()."""
+        return await self._run(self.manager.list_licenses, *args, **kwargs)
+
+    async def create_license(self, *args, **kwargs) -> Dict[str, Any]:
+        """See SW360LicenseManager.create_license()."""
+        return await self._run(self.manager.create_license, *args, **kwargs)
+
+    async def get_license(self, license_id: str) -> Dict[str, Any]:
+        """See SW360LicenseManager.get_license()."""
+        return await self._run(self.manager.get_license, license_id)
+
+    async def update_license(self, *args, **kwargs) -> Dict[str, Any]:
+        """See SW360LicenseManager.update_license()."""
+        return await self._run(self.manager.update_license, *args, **kwargs)
+
+    async def get_rev(self, license_id: str) -> str:
+        """See SW360LicenseManager.get_rev()."""
+        return await self._run(self.manager.get_rev, license_id)
+
+    async def update_license_fields(self, license_id: str, **fields) -> Dict[str, Any]:
+        """See SW360LicenseManager.update_license_fields()."""
+        return await self._run(self.manager.update_license_fields, license_id, **fields)
+
+    async def delete_license(self, license_id: str, rev: str) -> Dict[str, Any]:
+        """See SW360LicenseManager.delete_license()."""
+        return await self._run(self.manager.delete_license, license_id, rev)
+
+    async def bulk_create_licenses(self, licenses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.bulk_create_licenses()."""
+        return await self._run(self.manager.bulk_create_licenses, licenses)
+
+    async def bulk_update_licenses(self, licenses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.bulk_update_licenses()."""
+        return await self._run(self.manager.bulk_update_licenses, licenses)
+
+    async def bulk_delete_licenses(self, id_rev_pairs: Iterable[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.bulk_delete_licenses()."""
+        return await self._run(self.manager.bulk_delete_licenses, list(id_rev_pairs))
+
+    async def bulk_get(self, ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """See SW360LicenseManager.bulk_get()."""
+        return await self._run(self.manager.bulk_get, list(ids))
+
+    async def bulk_mark_checked(self, ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.bulk_mark_checked()."""
+        return await self._run(self.manager.bulk_mark_checked, list(ids))
+
+    async def find_by_short_name(self, short_name: str, include_docs: bool = True) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.find_by_short_name()."""
+        return await self._run(self.manager.find_by_short_name, short_name, include_docs)
+
+    async def get_osi_approved_licenses(self) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.get_osi_approved_licenses()."""
+        return await self._run(self.manager.get_osi_approved_licenses)
+
+    async def get_checked_licenses(self) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.get_checked_licenses()."""
+        return await self._run(self.manager.get_checked_licenses)
+
+    async def get_unchecked_licenses(self) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.get_unchecked_licenses()."""
+        return await self._run(self.manager.get_unchecked_licenses)
+
+    async def count_licenses(self) -> int:
+        """See SW360LicenseManager.count_licenses()."""
+        return await self._run(self.manager.count_licenses)
+
+    async def get_stats(self) -> Dict[str, int]:
+        """See SW360LicenseManager.get_stats()."""
+        return await self._run(self.manager.get_stats)
+
+    async def search_licenses(self, search_text: str, fields: List[str] = None) -> List[Dict[str, Any]]:
+        """See SW360LicenseManager.search_licenses()."""
+        return await self._run(self.manager.search_licenses, search_text, fields)
 
 
 # Convenience functions for quick operations
@@ -420,6 +1837,23 @@ def print_license(license: Dict[str, Any], detailed: bool = False):
     print(f"{'='*60}\n")
 
 
+async def _query_overview(manager: SW360LicenseManager) -> Tuple[Any, ...]:
+    """
+    Run the independent queries of main() concurrently.
+
+    Returns:
+        Tuple of (count, licenses, mit_licenses, osi_licenses, checked_licenses)
+    """
+    async with AsyncSW360LicenseManager(manager) as async_manager:
+        return await asyncio.gather(
+            async_manager.count_licenses(),
+            async_manager.list_licenses(limit=10),
+            async_manager.find_by_short_name("MIT"),
+            async_manager.get_osi_approved_licenses(),
+            async_manager.get_checked_licenses()
+        )
+
+
 def main():
     """
     Example usage and interactive testing.
@@ -443,14 +1877,17 @@ def main():
         if "sw360db" in databases:
             print("[OK] sw360db database exists")
 
+        # The following queries are independent, so run them concurrently
+        count, licenses, mit_licenses, osi_licenses, checked_licenses = asyncio.run(
+            _query_overview(manager)
+        )
+
         # Count licenses
         print("\n3. Counting licenses...")
-        count = manager.count_licenses()
         print(f"[OK] Found {count} licenses in database")
 
         # List licenses
         print("\n4. Listing all licenses...")
-        licenses = manager.list_licenses(limit=10)
         print(f"[OK] Retrieved {len(licenses)} licenses")
 
         for license in licenses:
@@ -471,7 +1908,6 @@ def main():
 
         # Example: Search for MIT license
         print("\n5. Searching for MIT license...")
-        mit_licenses = manager.find_by_short_name("MIT")
         if mit_licenses:
             print(f"[OK] Found {len(mit_licenses)} MIT license(s)")
             print_license(mit_licenses[0])
@@ -480,12 +1916,10 @@ def main():
 
         # Get OSI approved licenses
         print("\n6. Getting OSI approved licenses...")
-        osi_licenses = manager.get_osi_approved_licenses()
         print(f"[OK] Found {len(osi_licenses)} OSI approved licenses")
 
         # Get checked licenses
         print("\n7. Getting checked licenses...")
-        checked_licenses = manager.get_checked_licenses()
         print(f"[OK] Found {len(checked_licenses)} checked licenses")
 
         print("\n" + "=" * 60)
@@ -495,6 +1929,8 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] {e}")
         return 1
+    finally:
+        manager.close()
 
     return 0
 
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Tests for sw360_license_manager.
+
+No CouchDB server is needed; requests are answered by stubbing the
+manager's request methods.
+
+Run with: python -m unittest test_sw360_license_manager
+"""
+
+import gzip
+import json
+import threading
+import unittest
+
+from sw360_license_manager import CouchDBError, SW360LicenseManager, _iter_json_array
+
+
+class _LockHook:
+    """Lock wrapper running a callback once, right after the next release."""
+
+    def __init__(self, lock, callback):
+        self._lock = lock
+        self._callback = callback
+
+    def __enter__(self):
+        return self._lock.__enter__()
+
+    def __exit__(self, *exc_info):
+        self._lock.__exit__(*exc_info)
+        callback, self._callback = self._callback, None
+        if callback is not None:
+            callback()
+
+
+class LicenseCacheRaceTest(unittest.TestCase):
+    """A write made while a lookup is in flight must not be undone."""
+
+    def setUp(self):
+        self.manager = SW360LicenseManager()
+        self.stored = {"_id": "lic-1", "_rev": "1-a", "type": "license", "checked": False}
+
+    def test_read_overlapping_write_is_not_cached(self):
+        def get_while_writing(endpoint, method="GET", data=None):
+            old = dict(self.stored)
+            # The write completes (and invalidates) before the read returns
+            self.stored = dict(self.stored, _rev="2-b", checked=True)
+            self.manager._invalidate("lic-1")
+            return old
+
+        self.manager._make_request = get_while_writing
+        self.assertFalse(self.manager.get_license("lic-1")["checked"])
+
+        self.manager._make_request = lambda endpoint, method="GET", data=None: dict(self.stored)
+        license = self.manager.get_license("lic-1")
+        self.assertTrue(license["checked"])
+        self.assertEqual(license["_rev"], "2-b")
+
+    def test_short_name_lookup_finishing_during_invalidation_is_not_cached(self):
+        cache = self.manager._cache
+        key = ("short_name", "MIT", True)
+        old = [dict(self.stored, shortName="MIT")]
+
+        # The lookup has fetched the old document and is about to store it
+        generation = cache.generation
+        # It does so as soon as the invalidation first releases the lock
+        cache._lock = _LockHook(cache._lock, lambda: cache.put(key, old, generation))
+
+        self.stored = dict(self.stored, _rev="2-b")
+        self.manager._invalidate("lic-1", "MIT")
+
+        self.manager._make_request = lambda endpoint, method="GET", data=None: {
+            "rows": [{"id": "lic-1", "key": "MIT", "doc": dict(self.stored, shortName="MIT")}]
+        }
+        self.manager._design_doc_ready = True
+        self.assertEqual(self.manager.find_by_short_name("MIT")[0]["_rev"], "2-b")
+
+    def test_read_without_write_is_cached(self):
+        calls = []
+
+        def get(endpoint, method="GET", data=None):
+            calls.append(endpoint)
+            return dict(self.stored)
+
+        self.manager._make_request = get
+        self.manager.get_license("lic-1")
+        self.manager.get_license("lic-1")
+        self.assertEqual(calls, ["/lic-1"])
+
+
+class ResponseCacheRaceTest(unittest.TestCase):
+    """A response read while this manager writes must not be reused."""
+
+    def setUp(self):
+        self.manager = SW360LicenseManager(cache=False)
+        self.manager.cache_ttl = 60
+        self.stats = b'{"rows": [{"key": null, "value": 1}]}'
+
+    def test_read_overlapping_write_is_not_cached(self):
+        def raw_while_writing(endpoint, method="GET", data=None):
+            old = self.stats
+            # A write on another thread clears the cache before the read returns
+            self.stats = b'{"rows": [{"key": null, "value": 2}]}'
+            self.manager._resp_cache.clear()
+            return None, old
+
+        self.manager._make_raw_request = raw_while_writing
+        self.assertEqual(self.manager._make_request("/_find", "POST", {})["rows"][0]["value"], 1)
+
+        self.manager._make_raw_request = lambda endpoint, method="GET", data=None: (None, self.stats)
+        self.assertEqual(self.manager._make_request("/_find", "POST", {})["rows"][0]["value"], 2)
+
+    def test_read_without_write_is_cached(self):
+        calls = []
+
+        def raw(endpoint, method="GET", data=None):
+            calls.append(endpoint)
+            return None, self.stats
+
+        self.manager._make_raw_request = raw
+        self.manager._make_request("/_find", "POST", {})
+        self.manager._make_request("/_find", "POST", {})
+        self.assertEqual(calls, ["/_find"])
+
+
+class DesignDocTest(unittest.TestCase):
+    """Upgrading _design/licenses must keep entries added by others."""
+
+    def test_upgrade_keeps_foreign_views(self):
+        manager = SW360LicenseManager()
+        custom = {"map": "function (doc) { emit(doc._id, null); }"}
+        current = {
+            "_id": "_design/licenses",
+            "_rev": "1-a",
+            "views": {"custom": custom, "by_status": {"map": "old"}},
+            "updates": {"other": "function (doc, req) { return [doc, 'ok']; }"}
+        }
+        written = []
+
+        def request(endpoint, method="GET", data=None):
+            if method == "PUT":
+                written.append(data)
+                return {"ok": True}
+            return current
+
+        manager._make_request = request
+        manager._ensure_design_doc()
+
+        self.assertEqual(len(written), 1)
+        views = written[0]["views"]
+        self.assertEqual(views["custom"], custom)
+        self.assertEqual(views["by_status"], SW360LicenseManager._DESIGN_DOC["views"]["by_status"])
+        self.assertIn("other", written[0]["updates"])
+        self.assertIn("patch", written[0]["updates"])
+        self.assertEqual(written[0]["_rev"], "1-a")
+
+    def test_up_to_date_design_doc_is_not_rewritten(self):
+        manager = SW360LicenseManager()
+        current = dict(SW360LicenseManager._DESIGN_DOC, _id="_design/licenses", _rev="1-a")
+        current["views"] = dict(current["views"], custom={"map": "function (doc) {}"})
+        written = []
+
+        def request(endpoint, method="GET", data=None):
+            if method == "PUT":
+                written.append(data)
+            return current
+
+        manager._make_request = request
+        manager._ensure_design_doc()
+        self.assertEqual(written, [])
+
+
+class BatchThreadTest(unittest.TestCase):
+    """batch() only queues writes made on the thread that opened it."""
+
+    def test_other_threads_write_directly(self):
+        manager = SW360LicenseManager()
+        written = []
+
+        def request(endpoint, method="GET", data=None):
+            written.append((endpoint, method))
+            if endpoint == "/_bulk_docs":
+                return [{"ok": True, "id": doc["_id"], "rev": "1-a"} for doc in data["docs"]]
+            return {"ok": True, "id": data["_id"], "rev": "1-a"}
+
+        manager._make_request = request
+        results = []
+
+        with manager.batch() as batch:
+            self.assertIsNone(manager.create_license("A", "License A"))
+            thread = threading.Thread(
+                target=lambda: results.append(manager.create_license("B", "License B"))
+            )
+            thread.start()
+            thread.join()
+            self.assertEqual(written, [("", "POST")])
+            self.assertEqual(len(batch.docs), 1)
+
+        self.assertEqual(results[0]["ok"], True)
+        self.assertEqual(written, [("", "POST"), ("/_bulk_docs", "POST")])
+
+
+class _StubResponse:
+    """Minimal stand-in for http.client.HTTPResponse."""
+
+    def __init__(self, headers=None):
+        self._headers = headers or {}
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+
+class RequestCompressionTest(unittest.TestCase):
+    """Large bodies are gzipped, except for update function requests."""
+
+    def setUp(self):
+        self.manager = SW360LicenseManager()
+        self.manager._design_doc_ready = True
+        self.sent = []
+
+        def request_raw(method, path, body=None, headers=None):
+            self.sent.append((path, body, headers))
+            response = _StubResponse({"X-Couch-Update-NewRev": "2-b"})
+            return response, b'{"ok": true, "id": "abc", "rev": "2-b"}'
+
+        self.manager._request_raw = request_raw
+
+    def test_patch_request_is_not_compressed(self):
+        result = self.manager.update_license_fields("abc", text="x" * 2000)
+
+        path, body, headers = self.sent[0]
+        self.assertIn("/_update/patch/abc", path)
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertEqual(json.loads(body), {"text": "x" * 2000})
+        self.assertEqual(result["rev"], "2-b")
+
+    def test_large_document_put_is_compressed(self):
+        self.manager.update_license("abc", "1-a", "X", "X License", text="x" * 2000)
+
+        _, body, headers = self.sent[0]
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(body))["text"], "x" * 2000)
+
+
+class _StreamConnection:
+    """Stand-in for a pooled connection that records whether it was closed."""
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _StreamResponse(_StubResponse):
+    """Response whose body is read in pieces, like a socket."""
+
+    def __init__(self, body, status=200, headers=None):
+        super().__init__(headers)
+        self.status = status
+        self._body = body
+
+    def read(self, amt=None):
+        if amt is None:
+            amt = len(self._body)
+        data, self._body = self._body[:amt], self._body[amt:]
+        return data
+
+
+def _split(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    """_iter_json_array() decodes array items across any chunk boundaries."""
+
+    DOCS = [
+        {"_id": "a", "fullName": "Überprüfte Lizenz ✓", "text": "ends with ] and ["},
+        {"_id": "b", "shortName": "]]", "tags": ["x", "]"]},
+        {"_id": "c", "nested": {"docs": [1, 2]}}
+    ]
+
+    def test_any_chunk_size(self):
+        body = json.dumps({"docs": self.DOCS, "bookmark": "g1"}, ensure_ascii=False)
+        for size in (1, 2, 7, 100, len(body)):
+            with self.subTest(size=size):
+                self.assertEqual(list(_iter_json_array(_split(body, size), "docs")), self.DOCS)
+
+    def test_whitespace_around_marker(self):
+        body = '{"warning": "no index",\n "docs" :\n [ {"_id": "a"} ,\n {"_id": "b"} ]\n}'
+        for size in (1, 3, len(body)):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    list(_iter_json_array(_split(body, size), "docs")),
+                    [{"_id": "a"}, {"_id": "b"}]
+                )
+
+    def test_empty_array(self):
+        for body in ('{"docs": [], "bookmark": "nil"}', '{"docs":[ ]}'):
+            with self.subTest(body=body):
+                self.assertEqual(list(_iter_json_array(_split(body, 1), "docs")), [])
+
+    def test_missing_array(self):
+        self.assertEqual(list(_iter_json_array(['{"bookmark": "nil"}'], "docs")), [])
+
+    def test_truncated_body_raises(self):
+        with self.assertRaises(ValueError):
+            list(_iter_json_array(['{"docs": [{"_id": "a"}, {"_id": '], "docs"))
+
+
+class StreamFindTest(unittest.TestCase):
+    """_stream_find() reads Mango results from the socket incrementally."""
+
+    DOCS = IterJsonArrayTest.DOCS
+
+    def setUp(self):
+        self.manager = SW360LicenseManager()
+        self.connections = []
+
+    def respond(self, body, status=200, headers=None):
+        def urlopen(method, path, body_=None, headers_=None):
+            conn = _StreamConnection()
+            self.connections.append(conn)
+            return conn, _StreamResponse(body, status, headers)
+
+        self.manager._urlopen = urlopen
+
+    def test_chunk_sizes_splitting_utf8_and_marker(self):
+        body = json.dumps({"docs": self.DOCS, "bookmark": "g1"}, ensure_ascii=False).encode("utf-8")
+        for size in (1, 7, 100, 64 * 1024):
+            with self.subTest(size=size):
+                self.manager.STREAM_CHUNK_SIZE = size
+                self.respond(body)
+                self.assertEqual(list(self.manager._stream_find({"selector": {}})), self.DOCS)
+                self.assertFalse(self.connections[-1].closed)
+                self.assertIs(self.manager._pool[-1], self.connections[-1])
+
+    def test_gzip_response(self):
+        body = gzip.compress(json.dumps({"docs": self.DOCS}, ensure_ascii=False).encode("utf-8"))
+        for size in (1, 7, 64 * 1024):
+            with self.subTest(size=size):
+                self.manager.STREAM_CHUNK_SIZE = size
+                self.respond(body, headers={"Content-Encoding": "gzip"})
+                self.assertEqual(list(self.manager._stream_find({"selector": {}})), self.DOCS)
+
+    def test_empty_result(self):
+        self.respond(b'{"docs": [], "bookmark": "nil"}')
+        self.assertEqual(list(self.manager._stream_find({"selector": {}})), [])
+
+    def test_error_status_closes_connection(self):
+        self.respond(b'{"error": "bad_request", "reason": "invalid selector"}', status=400)
+        with self.assertRaises(CouchDBError) as raised:
+            list(self.manager._stream_find({"selector": {}}))
+
+        self.assertEqual(raised.exception.status, 400)
+        self.assertIn("invalid selector", str(raised.exception))
+        self.assertTrue(self.connections[0].closed)
+        self.assertEqual(self.manager._pool, [])
+
+    def test_partially_read_response_closes_connection(self):
+        self.respond(json.dumps({"docs": self.DOCS}).encode("utf-8"))
+        documents = self.manager._stream_find({"selector": {}})
+        next(documents)
+        documents.close()
+
+        self.assertTrue(self.connections[0].closed)
+        self.assertEqual(self.manager._pool, [])
+
+
+if __name__ == "__main__":
+    unittest.main()